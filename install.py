@@ -17,350 +17,477 @@ Usage: python install.py
 
 import os
 import sys
+import hashlib
 import platform
 import subprocess
 import shutil
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
 
 # Constants
 REQUIREMENTS_URL = "https://raw.githubusercontent.com/GreenBeanGravy/BlizzardSoundRipper/main/requirements.txt"
 QUICKBMS_REPO = "https://github.com/LittleBigBug/QuickBMS/releases/latest/download"
 VGMSTREAM_REPO = "https://github.com/vgmstream/vgmstream/releases/latest/download"
 
+# Shared HTTP session so repeated requests reuse pooled keep-alive
+# connections (and their TLS handshakes) instead of reconnecting each time
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 
 def fetch_requirements_file():
     """
     Downloads requirements.txt from GitHub repository if not found locally.
-    
+
     This ensures that the script can install all necessary Python dependencies
-    even if the user hasn't downloaded the full repository.
-    
+    even if the user hasn't downloaded the full repository. The ETag from the
+    last download is kept in a sidecar file so repeat fetches can revalidate
+    with a conditional GET and skip the body transfer on a 304 response.
+
     Returns:
         Path: Path to the requirements file (either local or downloaded)
     """
     local_req = Path("requirements.txt")
-    
-    # Check if requirements.txt exists locally
-    if local_req.exists():
+    etag_file = Path(".requirements.etag")
+
+    # A locally present requirements.txt without a recorded ETag came with
+    # the repository checkout; use it as-is
+    if local_req.exists() and not etag_file.exists():
         print("Found local requirements.txt file.")
         return local_req
-    
-    print("Local requirements.txt not found. Fetching from GitHub repository...")
+
+    print("Fetching requirements.txt from GitHub repository...")
     try:
-        # Download requirements.txt from GitHub
-        response = requests.get(REQUIREMENTS_URL)
+        # Revalidate a previously downloaded copy with a conditional GET
+        headers = {}
+        if local_req.exists() and etag_file.exists():
+            headers['If-None-Match'] = etag_file.read_text().strip()
+
+        response = SESSION.get(REQUIREMENTS_URL, headers=headers)
+        if response.status_code == 304:
+            print("Local requirements.txt is up to date.")
+            return local_req
         response.raise_for_status()  # Raise exception for HTTP errors
-        
+
         # Save the downloaded content to local file
         with open(local_req, 'w') as f:
             f.write(response.text)
-        
+
+        # Record the ETag for the next run's conditional GET
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_file.write_text(etag)
+
         print("Downloaded requirements.txt successfully.")
         return local_req
     except Exception as e:
         print(f"Error fetching requirements.txt: {e}")
+        if local_req.exists():
+            print("Using the existing local requirements.txt instead.")
+            return local_req
         print("Continuing without installing requirements.")
         return None
 
 
-def get_latest_quickbms_url():
+# Detect the operating system once at import time; it can't change within
+# a process, and on Windows platform.system() is not free
+_OS = platform.system().lower()
+
+# Release zip filename per OS for each tool. For Windows, vgmstream uses
+# the standard build instead of the 64-bit specific version
+_OS_TO_FILENAME = {
+    "windows": ("quickbms_win.zip", "vgmstream-win.zip"),
+    "darwin": ("quickbms_macosx.zip", "vgmstream-mac-cli.zip"),
+    "linux": ("quickbms_linux.zip", "vgmstream-linux-cli.zip"),
+}
+
+
+def _release_url(repo, filename_index):
     """
-    Determines the appropriate QuickBMS download URL based on the operating system.
-    
-    Detects Windows, macOS, or Linux and selects the corresponding zip file
-    from the QuickBMS repository.
-    
+    Builds the (download_url, filename) pair for the detected OS.
+
+    Args:
+        repo: Base release download URL for the tool
+        filename_index: Column in _OS_TO_FILENAME for the tool
+
     Returns:
-        tuple: (download_url, filename) for the appropriate QuickBMS release
+        tuple: (download_url, filename) for the appropriate release
     """
-    os_type = platform.system().lower()
-    
-    if os_type == "windows":
-        filename = "quickbms_win.zip"
-    elif os_type == "darwin":
-        filename = "quickbms_macosx.zip"
-    elif os_type == "linux":
-        filename = "quickbms_linux.zip"
-    else:
-        raise SystemExit(f"Unsupported operating system: {os_type}")
-    
-    download_url = f"{QUICKBMS_REPO}/{filename}"
-    return download_url, filename
+    try:
+        filename = _OS_TO_FILENAME[_OS][filename_index]
+    except KeyError:
+        raise SystemExit(f"Unsupported operating system: {_OS}")
+    return f"{repo}/{filename}", filename
+
+
+def get_latest_quickbms_url():
+    """
+    Returns the (download_url, filename) for the QuickBMS release matching
+    the detected operating system.
+    """
+    return _release_url(QUICKBMS_REPO, 0)
 
 
 def get_latest_vgmstream_url():
     """
-    Determines the appropriate vgmstream download URL based on the operating system.
-    
-    Detects Windows, macOS, or Linux and selects the corresponding zip file
-    from the vgmstream repository. For Windows, uses the standard build instead
-    of the 64-bit specific version.
-    
+    Returns the (download_url, filename) for the vgmstream release matching
+    the detected operating system.
+    """
+    return _release_url(VGMSTREAM_REPO, 1)
+
+
+def _requirements_satisfied(req_file):
+    """
+    Checks whether the current environment already satisfies requirements.txt.
+
+    Parses each requirement line and compares it against the installed
+    distribution metadata, so pip's multi-second startup and resolver run
+    can be skipped entirely on re-runs.
+
+    Args:
+        req_file: Path to the requirements.txt file
+
     Returns:
-        tuple: (download_url, filename) for the appropriate vgmstream release
+        bool: True if every requirement is already installed and satisfied
     """
-    os_type = platform.system().lower()
-    
-    if os_type == "windows":
-        filename = "vgmstream-win.zip"  # Using regular Windows build, not the 64-bit one
-    elif os_type == "darwin":
-        filename = "vgmstream-mac-cli.zip"
-    elif os_type == "linux":
-        filename = "vgmstream-linux-cli.zip"
-    else:
-        raise SystemExit(f"Unsupported operating system: {os_type}")
-    
-    download_url = f"{VGMSTREAM_REPO}/{filename}"
-    return download_url, filename
+    try:
+        import importlib.metadata
+        from packaging.requirements import Requirement
+    except ImportError:
+        # Without packaging we can't evaluate specifiers; let pip decide
+        return False
+
+    try:
+        for line in Path(req_file).read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            requirement = Requirement(line)
+            try:
+                version = importlib.metadata.version(requirement.name)
+            except importlib.metadata.PackageNotFoundError:
+                return False
+            if not requirement.specifier.contains(version, prereleases=True):
+                return False
+        return True
+    except Exception:
+        # Anything unparseable (URLs, editable installs, ...) goes to pip
+        return False
 
 
-def install_requirements(req_file):
+def start_requirements_install(req_file):
     """
-    Installs Python dependencies from requirements.txt.
-    
+    Launches pip install of requirements.txt as a background process.
+
+    pip is network-bound against PyPI and shares nothing with the tool
+    downloads, so it runs concurrently with them. Its output goes to
+    pip_install.log so it doesn't interleave with the download progress
+    bars.
+
     Args:
         req_file: Path to the requirements.txt file
-    
+
     Returns:
-        bool: True if installation was successful or skipped, False on error
+        subprocess.Popen or None: Handle for the running pip process, or
+        None if the install was skipped or could not be started
     """
-    print("Installing requirements...")
-    
     if not req_file or not Path(req_file).exists():
         print("Requirements file not available. Skipping requirements installation.")
-        return True
-    
+        return None
+
+    # Skip pip's startup and resolver entirely when nothing needs installing
+    if _requirements_satisfied(req_file):
+        print("Requirements already satisfied.")
+        return None
+
+    print("Installing requirements in the background...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(req_file)])
-        print("Requirements installed successfully.")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error installing requirements: {e}")
+        # Popen duplicates the descriptor into the child, so the parent's
+        # handle can be closed as soon as the process is launched
+        with open("pip_install.log", "w") as log_file:
+            return subprocess.Popen(
+                [sys.executable, "-m", "pip", "install",
+                 "--disable-pip-version-check", "--quiet", "-r", str(req_file)],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+    except Exception as e:
+        print(f"Error starting requirements install: {e}")
         print("Continuing with installation despite requirements error.")
-        return False
+        return None
 
 
-def download_file(url, filename):
+def warm_connections():
     """
-    Downloads a file from a URL with a progress bar.
-    
-    Uses tqdm to display download progress and handles HTTP errors
-    appropriately.
-    
+    Fires best-effort HEAD requests at the release hosts before downloading.
+
+    Resolving DNS and negotiating TLS for both download URLs ahead of time
+    means the real GETs start transferring immediately instead of paying
+    the handshake latency first. Failures are ignored; the downloads will
+    simply do their own handshakes.
+    """
+    def _head(url):
+        try:
+            SESSION.head(url, allow_redirects=False, timeout=5)
+        except Exception:
+            pass
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    for url in (QUICKBMS_REPO, VGMSTREAM_REPO):
+        executor.submit(_head, url)
+    executor.shutdown(wait=False)
+
+
+def finish_requirements_install(pip_proc):
+    """
+    Waits for the background pip process and reports its outcome.
+
     Args:
-        url: URL to download from
-        filename: Local path where the downloaded file will be saved
-    
+        pip_proc: Popen handle from start_requirements_install, or None
+
     Returns:
-        bool: True if download was successful, False otherwise
+        bool: True if installation was successful or skipped, False on error
     """
-    print(f"Downloading {filename}...")
-    try:
-        # Send HTTP request with stream=True to download in chunks
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
-        # Get total file size for progress bar
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024  # 1 Kibibyte
-        
-        # Download with progress bar
-        with open(filename, 'wb') as file, tqdm(
-                desc=filename,
-                total=total_size,
-                unit='iB',
-                unit_scale=True,
-                unit_divisor=1024,
-        ) as bar:
-            for data in response.iter_content(block_size):
-                size = file.write(data)
-                bar.update(size)
-                
-        print(f"Download completed: {filename}")
+    if pip_proc is None:
+        return True
+
+    if pip_proc.wait() == 0:
+        print("Requirements installed successfully.")
         return True
-    except Exception as e:
-        print(f"Error downloading file: {e}")
-        return False
 
+    print("Error installing requirements; see pip_install.log for details.")
+    print("Continuing with installation despite requirements error.")
+    return False
 
-def extract_zip(zip_path):
+
+CACHE_DIR = Path.home() / ".cache" / "blizzardsoundripper"
+
+# Release assets are already-compressed zips, so ask for the raw bytes:
+# no pointless gzip negotiation, and content-length matches what we store
+DOWNLOAD_HEADERS = {
+    'Accept-Encoding': 'identity',
+    'User-Agent': 'BlizzardSoundRipper-installer',
+}
+
+
+def _cache_lookup(etag):
     """
-    Extracts a ZIP archive to a folder with the same base name.
-    
+    Looks up a previously downloaded archive for the given ETag.
+
+    The sidecar file named after the ETag records the SHA-256 of the
+    cached zip; the zip itself is stored under that digest. The digest is
+    re-verified with hashlib.file_digest before the cache hit is trusted.
+
     Args:
-        zip_path: Path to the ZIP file to extract
-    
+        etag: ETag header value from the release asset, or None
+
     Returns:
-        str or None: Path to the extraction directory if successful, None otherwise
+        Path or None: Path to the verified cached zip, or None on a miss
     """
-    print(f"Extracting {zip_path}...")
-    
-    # Extract the base filename without extension for the output folder
-    folder_name = os.path.splitext(zip_path)[0]
-    
+    if not etag:
+        return None
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(folder_name)
-        print(f"Extraction completed to {folder_name}/")
-        return folder_name
-    except Exception as e:
-        print(f"Error extracting zip file: {e}")
+        sidecar = CACHE_DIR / f"{hashlib.sha256(etag.encode()).hexdigest()}.sha"
+        if not sidecar.exists():
+            return None
+        digest = sidecar.read_text().strip()
+        cached_zip = CACHE_DIR / f"{digest}.zip"
+        if not cached_zip.exists():
+            return None
+        with open(cached_zip, 'rb') as f:
+            if hashlib.file_digest(f, 'sha256').hexdigest() != digest:
+                return None
+        return cached_zip
+    except Exception:
         return None
 
 
-def copy_files(source_dir, dest_dir="."):
+def _cache_store(buf, etag):
     """
-    Recursively copies all files from source directory to destination directory.
-    
-    Preserves directory structure and handles path resolution to prevent errors.
-    
+    Stores a downloaded archive in the cache, keyed by content digest.
+
     Args:
-        source_dir: Directory containing files to copy
-        dest_dir: Destination directory (defaults to current directory)
-    
-    Returns:
-        bool: True if at least one file was copied successfully, False otherwise
+        buf: Seekable file-like object positioned anywhere in the zip data
+        etag: ETag header value from the release asset, or None
     """
-    source_dir = str(source_dir)  # Ensure string path
-    dest_dir = str(dest_dir) if dest_dir else "."  # Ensure string path with default
-    
-    print(f"Copying files from '{source_dir}' to '{dest_dir}'...")
-    
+    if not etag:
+        return
     try:
-        # Convert to Path objects for better path handling
-        source_path = Path(source_dir).resolve()
-        dest_path = Path(dest_dir).resolve()
-        
-        # Validate source directory
-        if not source_path.exists():
-            print(f"Error: Source directory '{source_path}' does not exist")
-            return False
-            
-        # Create destination directory if needed
-        dest_path.mkdir(parents=True, exist_ok=True)
-            
-        # Debug information
-        print(f"Source directory (absolute): {source_path}")
-        print(f"Destination directory (absolute): {dest_path}")
-        
-        # Find and count all files to copy
-        files_to_copy = list(source_path.glob('**/*'))
-        file_count = len([f for f in files_to_copy if f.is_file()])
-        print(f"Found {file_count} files to copy")
-        
-        if file_count == 0:
-            print(f"Warning: No files found in {source_path}")
-            # List contents of the directory for debugging
-            print(f"Contents of source directory: {list(source_path.iterdir())}")
-            return False
-        
-        # Copy files with proper path handling
-        copied_files = []
-        for item in files_to_copy:
-            if item.is_file():
-                # Get relative path from source directory
-                try:
-                    rel_path = item.relative_to(source_path)
-                    dest_file = dest_path / rel_path
-                    
-                    # Create parent directories
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file with metadata
-                    shutil.copy2(str(item), str(dest_file))
-                    copied_files.append(str(rel_path))
-                    
-                except Exception as e:
-                    print(f"Error copying file {item}: {e}")
-        
-        print(f"Successfully copied {len(copied_files)} files.")
-        return len(copied_files) > 0
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        buf.seek(0)
+        # mkstemp gives each call its own staging file: both installer
+        # threads share a pid, so a pid-based name would let concurrent
+        # stores clobber each other's partial writes
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR,
+                                            prefix=".partial-", suffix=".zip")
+        with os.fdopen(tmp_fd, 'wb') as f:
+            shutil.copyfileobj(buf, f, length=1 << 20)
+        with open(tmp_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        os.replace(tmp_path, CACHE_DIR / f"{digest}.zip")
+        sidecar = CACHE_DIR / f"{hashlib.sha256(etag.encode()).hexdigest()}.sha"
+        sidecar.write_text(digest)
     except Exception as e:
-        print(f"Error during file copying: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        print(f"Warning: could not cache download: {e}")
 
 
-def cleanup(zip_path, folder_path):
+def stream_extract(url, filename, dest_dir, progress):
     """
-    Removes temporary files and directories created during installation.
-    
+    Downloads a ZIP archive and extracts it without writing the archive to disk.
+
+    The response body is spooled through a temporary buffer (small archives
+    stay in RAM, large ones spill to a temp file) and fed straight to
+    zipfile, so only the extracted files ever hit the destination directory.
+    Progress is reported on a bar shared by all concurrent downloads; the
+    blocking reads release the GIL, so downloads running on separate threads
+    overlap their network transfers. Downloads are kept in a
+    content-addressed cache keyed by the asset's ETag, so re-runs against an
+    unchanged release extract locally without any transfer.
+
     Args:
-        zip_path: Path to the ZIP file to remove
-        folder_path: Path to the extracted folder to remove
-    
+        url: URL to download the ZIP archive from
+        filename: Display name for log messages
+        dest_dir: Directory where the archive contents will be extracted
+        progress: Shared tqdm bar tracking total bytes across downloads
+
     Returns:
-        bool: True if cleanup was successful, False otherwise
+        bool: True if download and extraction succeeded, False otherwise
     """
-    print("Cleaning up temporary files...")
-    
     try:
-        # Delete zip file
-        if os.path.exists(zip_path):
-            os.remove(zip_path)
-            print(f"Deleted: {zip_path}")
-        
-        # Delete extracted folder
-        if os.path.exists(folder_path):
-            shutil.rmtree(folder_path)
-            print(f"Deleted: {folder_path}")
-            
+        # Check the local cache first: if the asset's ETag matches a
+        # previous download, extract straight from disk with zero network.
+        # The HEAD also resolves the release 302 to its CDN URL, so the
+        # GET below skips a redirect round-trip and handshake
+        etag = None
+        final_url = url
+        try:
+            head = SESSION.head(url, allow_redirects=True,
+                                headers=DOWNLOAD_HEADERS, timeout=30)
+            etag = head.headers.get('ETag')
+            final_url = head.url
+        except Exception:
+            pass
+
+        cached_zip = _cache_lookup(etag)
+        if cached_zip:
+            print(f"Using cached download for {filename}...")
+            with open(cached_zip, 'rb') as buf:
+                _extract_buffer(buf, dest_dir)
+            print(f"Extraction completed to {dest_dir}/")
+            return True
+
+        print(f"Downloading {filename}...")
+        with tempfile.SpooledTemporaryFile(max_size=32 << 20) as buf:
+            response = SESSION.get(final_url, stream=True,
+                                   headers=DOWNLOAD_HEADERS)
+            response.raise_for_status()
+
+            # Grow the shared bar by this download's size so the total
+            # reflects all transfers in flight
+            total_size = int(response.headers.get('content-length', 0))
+            progress.total = (progress.total or 0) + total_size
+            progress.refresh()
+
+            # Copy the raw body into the spool with a C-level loop; the
+            # wrapper feeds each read's size to the shared progress bar
+            response.raw.decode_content = True
+            wrapped = CallbackIOWrapper(progress.update, response.raw, "read")
+            shutil.copyfileobj(wrapped, buf, length=1 << 20)
+
+            # Extract straight from the buffer; zipfile needs a seekable
+            # stream for the central directory, which the spool provides
+            buf.seek(0)
+            _extract_buffer(buf, dest_dir)
+
+            # Keep the archive for future runs
+            _cache_store(buf, etag)
+
+        print(f"Extraction completed to {dest_dir}/")
         return True
     except Exception as e:
-        print(f"Error during cleanup: {e}")
+        print(f"Error downloading or extracting {filename}: {e}")
         return False
 
 
-def install_tool(name, url_func, current_dir):
+def _extract_buffer(buf, dest_dir):
+    """
+    Extracts a ZIP archive from an open seekable buffer into dest_dir.
+
+    Copies each member out with a 1 MiB buffer instead of extractall's
+    8 KiB default, which matters for the large stored (uncompressed)
+    entries some of the tool archives contain. Unix permission bits are
+    preserved so the quickbms/vgmstream binaries stay executable.
+
+    Args:
+        buf: Seekable file-like object containing the ZIP data
+        dest_dir: Directory where the archive contents will be extracted
+    """
+    dest_path = Path(dest_dir)
+    dest_root = os.path.realpath(dest_path)
+    with zipfile.ZipFile(buf) as zip_ref:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            target = dest_path / info.filename
+            # Refuse members that climb out of the destination (e.g. a
+            # "../evil" name), matching the checks extractall performs
+            resolved = os.path.realpath(target)
+            if os.path.commonpath([dest_root, resolved]) != dest_root:
+                print(f"Skipping unsafe archive member: {info.filename}")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+            mode = (info.external_attr >> 16) & 0o777
+            if mode:
+                os.chmod(target, mode)
+
+
+def install_tool(name, url_func, current_dir, progress):
     """
     Generic function to install a tool (QuickBMS or vgmstream).
-    
-    Handles the download, extraction, copying, and cleanup process for
-    a specific tool based on the provided parameters.
-    
+
+    Handles the download and extraction process for a specific tool based
+    on the provided parameters. Designed to run on a worker thread so
+    several tools can install concurrently; the download I/O releases the
+    GIL while it blocks.
+
     Args:
         name: Name of the tool being installed
         url_func: Function to get the download URL for the tool
         current_dir: Current working directory
-    
+        progress: Shared tqdm bar tracking total bytes across downloads
+
     Returns:
         bool: True if installation was successful, False otherwise
     """
     print(f"\n=== Installing {name} ===")
-    
+
     # Get the appropriate download URL and filename
     download_url, filename = url_func()
-    if not download_file(download_url, filename):
+
+    # Stream the archive straight from the HTTP response into the install
+    # directory; extracting into an intermediate folder and copying from
+    # there wrote every extracted byte twice
+    if not stream_extract(download_url, filename, current_dir, progress):
         print(f"Failed to download {name}. Installation aborted.")
         return False
-    
-    # Extract the zip file
-    extract_dir = extract_zip(filename)
-    if not extract_dir:
-        print(f"Failed to extract {name}. Installation aborted.")
-        return False
-    
-    # Copy all files to the current directory
-    if not copy_files(extract_dir, current_dir):
-        print(f"WARNING: Failed to copy {name} files.")
-        success = False
-    else:
-        success = True
-    
-    # Clean up temporary files
-    cleanup(filename, extract_dir)
-    
-    if success:
-        print(f"{name} installation completed successfully!")
-    else:
-        print(f"{name} installation completed with warnings.")
-    
-    return success
+
+    print(f"{name} installation completed successfully!")
+    return True
 
 
 def main():
@@ -378,16 +505,39 @@ def main():
     current_dir = os.getcwd()
     print(f"Installing to directory: {current_dir}")
     
-    # Step 1: Handle requirements.txt
-    req_file = fetch_requirements_file()
-    install_requirements(req_file)
-    
-    # Step 2: Install QuickBMS
-    quickbms_success = install_tool("QuickBMS", get_latest_quickbms_url, current_dir)
-    
-    # Step 3: Install vgmstream
-    vgmstream_success = install_tool("vgmstream", get_latest_vgmstream_url, current_dir)
-    
+    try:
+        # Warm up DNS and TLS state for the release hosts while the
+        # requirements step runs
+        warm_connections()
+
+        # Step 1: Kick off the requirements install in the background; pip
+        # talks to PyPI while the tool downloads talk to GitHub, so the two
+        # network workloads overlap
+        req_file = fetch_requirements_file()
+        pip_proc = start_requirements_install(req_file)
+
+        # Steps 2 and 3: Install QuickBMS and vgmstream concurrently so
+        # their independent downloads overlap instead of running
+        # back-to-back. One aggregate bar tracks both transfers; each grows
+        # the total as its size becomes known
+        with tqdm(desc="Downloading tools", total=0, unit='iB',
+                  unit_scale=True, unit_divisor=1024,
+                  mininterval=0.2) as progress:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                quickbms_future = executor.submit(
+                    install_tool, "QuickBMS", get_latest_quickbms_url,
+                    current_dir, progress)
+                vgmstream_future = executor.submit(
+                    install_tool, "vgmstream", get_latest_vgmstream_url,
+                    current_dir, progress)
+                quickbms_success = quickbms_future.result()
+                vgmstream_success = vgmstream_future.result()
+
+        # Collect the background pip result before reporting
+        finish_requirements_install(pip_proc)
+    finally:
+        SESSION.close()
+
     # Final status report
     print("\n=== Installation Summary ===")
     print(f"QuickBMS: {'SUCCESS' if quickbms_success else 'WARNING'}")